@@ -1,7 +1,148 @@
-import yfinance as yf
+import copy
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 import numpy as np
 import pandas as pd
-from scipy.stats import norm
+
+# yfinance, requests, scipy and numba are imported on first use to keep start-up fast.
+
+# Maximum number of symbols requested from Yahoo Finance in a single download.
+YF_BATCH_SIZE = 20
+# Number of worker threads for non-stock fetches, and the time (seconds) to wait for all of them.
+FETCH_MAX_WORKERS = 8
+FETCH_TIMEOUT = 60
+# Number of Monte Carlo simulations drawn per tile, sized so that a tile stays in cache.
+MC_TILE_SIZE = 8192
+
+# yf.download resets and fills module-level state on every call, so calls must not overlap.
+_YF_DOWNLOAD_LOCK = threading.Lock()
+
+# The compiled Monte Carlo kernel, built on first use. False if Numba is not installed.
+_mc_kernel = None
+
+
+def _load_mc_kernel():
+    """
+    Returns the Numba-compiled Monte Carlo kernel, importing Numba and compiling the kernel on
+    first use.
+
+    Returns:
+        function or None: The compiled kernel, or None if Numba is not installed.
+    """
+    global _mc_kernel
+    if _mc_kernel is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _mc_kernel = False
+        else:
+            @njit(fastmath=True)
+            def _mc_portfolio_returns_numba(rng, v, mean_dot_w, n_sim, out):
+                n = v.shape[0]
+                for i in range(n_sim):
+                    acc = 0.0
+                    for j in range(n):
+                        acc += rng.standard_normal() * v[j]
+                    out[i] = acc + mean_dot_w
+            _mc_kernel = _mc_portfolio_returns_numba
+    return _mc_kernel or None
+
+
+def mc_portfolio_returns(rng, L, mean, weights, n_sim, use_numba=False):
+    """
+    Simulates portfolio returns (mean + L @ z) @ weights from standard normals z. The product
+    is evaluated as z @ (L.T @ weights) + mean @ weights, so each simulation costs one dot
+    product of length N and the simulated asset returns are never formed. Simulations are
+    drawn in tiles of MC_TILE_SIZE to keep the working set in cache. The normals are drawn and
+    the computation runs in the floating point type of the input arrays, so float32 and float64
+    give different random streams for the same seed.
+
+    With use_numba, a Numba-compiled loop draws each normal from the same generator and
+    accumulates the dot product directly, so no tile of normals is stored either. It draws
+    the same stream as the NumPy path. Falls back to NumPy when Numba is not installed.
+
+    Args:
+        rng (np.random.Generator): The random number generator used to draw the standard normals.
+        L (np.ndarray): The lower Cholesky factor of the returns covariance matrix.
+        mean (np.ndarray): The mean daily return of each asset.
+        weights (np.ndarray): The portfolio weight of each asset.
+        n_sim (int): The number of simulations to run.
+        use_numba (bool): Whether to run the simulations in the Numba-compiled loop.
+
+    Returns:
+        np.ndarray: The simulated portfolio returns.
+    """
+    n = mean.shape[0]
+    v = L.T @ weights
+    mean_dot_w = mean @ weights
+    out = np.empty(n_sim, dtype=mean.dtype)
+    kernel = _load_mc_kernel() if use_numba else None
+    if kernel is not None:
+        kernel(rng, v, mean_dot_w, n_sim, out)
+        return out
+    for start in range(0, n_sim, MC_TILE_SIZE):
+        stop = min(start + MC_TILE_SIZE, n_sim)
+        z = rng.standard_normal((stop - start, n), dtype=mean.dtype)
+        np.matmul(z, v, out=out[start:stop])
+    out += mean_dot_w
+    return out
+
+
+@functools.lru_cache(maxsize=16)
+def _z_score(confidence_level):
+    """
+    Returns the standard normal quantile for the loss tail of the given confidence level. Results
+    are cached, as only a few distinct confidence levels are used in practice.
+
+    Args:
+        confidence_level (float): The confidence level for the VaR calculation.
+
+    Returns:
+        float: The z-score norm.ppf(1 - confidence_level).
+    """
+    from scipy.stats import norm
+    return norm.ppf(1 - confidence_level)
+
+
+def _percentile(values, q):
+    """
+    Returns the q-th percentile along the first axis of an array with the same linear interpolation
+    as np.percentile, but selects only the two neighbouring order statistics with np.partition
+    instead of a full quantile computation. The array is partially reordered in place.
+
+    Args:
+        values (np.ndarray): The values to compute the percentile of, either 1-D or one column per series.
+        q (float): The percentile to compute, between 0 and 100.
+
+    Returns:
+        float or np.ndarray: The q-th percentile of the values, one per column for 2-D input.
+    """
+    position = (values.shape[0] - 1) * q / 100
+    lower = int(np.floor(position))
+    upper = min(lower + 1, values.shape[0] - 1)
+    values.partition([lower, upper], axis=0)
+    result = values[lower] + (values[upper] - values[lower]) * (position - lower)
+    return float(result) if values.ndim == 1 else result
+
+
+def _covariance_factor(covariance_matrix):
+    """
+    Returns a matrix L such that L @ L.T equals the covariance matrix. The Cholesky factor is
+    used when the matrix is positive definite, otherwise an eigendecomposition is used.
+
+    Args:
+        covariance_matrix (np.ndarray): A symmetric positive semi-definite matrix.
+
+    Returns:
+        np.ndarray: The factor of the covariance matrix.
+    """
+    try:
+        return np.linalg.cholesky(covariance_matrix)
+    except np.linalg.LinAlgError:
+        eigenvalues, eigenvectors = np.linalg.eigh(covariance_matrix)
+        return np.ascontiguousarray(eigenvectors * np.sqrt(np.clip(eigenvalues, 0, None)))
+
 
 class FinancialInstrument:
     """
@@ -12,6 +153,9 @@ class FinancialInstrument:
         quantity (int or float): The quantity of the financial instrument held in the portfolio.
         data (pd.Series): Time series data for the financial instrument, typically the adjusted closing prices.
         returns (pd.Series): Daily returns of the financial instrument, computed from the data.
+
+    Once the instrument belongs to a portfolio whose price matrix has been built, data and returns
+    are read from the portfolio's matrices, and quantity changes are written through to it.
     """
 
     def __init__(self, ticker, quantity):
@@ -22,11 +166,69 @@ class FinancialInstrument:
             ticker (str): The ticker symbol of the financial instrument.
             quantity (int or float): The quantity of the financial instrument held.
         """
+        self._portfolio = None
+        self._col_idx = None
         self.ticker = ticker
         self.quantity = quantity
         self.data = None
         self.returns = None
 
+    def _in_price_matrix(self):
+        """
+        Returns True if the instrument is a column of its portfolio's current price matrix.
+        """
+        return self._portfolio is not None and self._portfolio._price_matrix is not None and self._col_idx is not None
+
+    @property
+    def quantity(self):
+        """
+        int or float: The quantity of the financial instrument held in the portfolio.
+        """
+        return self._quantity
+
+    @quantity.setter
+    def quantity(self, value):
+        self._quantity = value
+        if self._portfolio is not None:
+            self._portfolio._quantity_changed(self)
+
+    @property
+    def data(self):
+        """
+        pd.Series: The adjusted closing prices, aligned on the portfolio's common dates once the
+        price matrix has been built.
+        """
+        if self._in_price_matrix():
+            portfolio = self._portfolio
+            return pd.Series(portfolio._price_matrix[:, self._col_idx], index=portfolio._common_index, name=self.ticker)
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        # yf.download(ticker)['Adj Close'] is a one-column DataFrame on newer yfinance versions.
+        if isinstance(value, pd.DataFrame):
+            if value.shape[1] != 1:
+                raise ValueError(f"Expected a single price series for {self.ticker}, got {value.shape[1]} columns.")
+            value = value.squeeze(axis=1)
+        self._data = value
+        if self._portfolio is not None:
+            self._portfolio._invalidate_cache()
+
+    @property
+    def returns(self):
+        """
+        pd.Series: The daily returns, read from the portfolio's returns matrix once it has been computed.
+        """
+        if self._in_price_matrix() and self._portfolio._returns_matrix is not None:
+            portfolio = self._portfolio
+            return pd.Series(portfolio._returns_matrix[:, self._col_idx], index=portfolio._common_index[1:],
+                             name=self.ticker)
+        return self._returns
+
+    @returns.setter
+    def returns(self, value):
+        self._returns = value
+
     def fetch_data(self, start_date, end_date):
         """
         Fetches historical data for the financial instrument within the given date range.
@@ -53,10 +255,18 @@ class FinancialInstrument:
     def compute_returns(self):
         """
         Computes the daily returns of the financial instrument based on its historical data.
-        Returns are computed as the percentage change in adjusted closing prices.
-        """
-        if self.data is not None:
-            self.returns = self.data.pct_change().dropna()
+        Returns are computed as the percentage change in adjusted closing prices. If the
+        instrument is part of a portfolio's price matrix, the portfolio's returns matrix is
+        computed instead and the instrument's returns are read from it.
+        """
+        if self._in_price_matrix():
+            if self._portfolio._returns_matrix is None:
+                self._portfolio.compute_returns()
+        elif self.data is not None:
+            prices = self.data.to_numpy(dtype=np.float64)
+            returns = prices[1:] / prices[:-1] - 1.0
+            name = getattr(self.data, "name", self.ticker)
+            self.returns = pd.Series(returns, index=self.data.index[1:], name=name, copy=False).dropna()
         else:
             self.returns = pd.Series(dtype='float64')
 
@@ -98,8 +308,10 @@ class Stock(FinancialInstrument):
         Raises:
             Exception: If an error occurs while fetching the data.
         """
+        import yfinance as yf
         try:
-            self.data = yf.download(self.ticker, start=start_date, end=end_date)['Adj Close']
+            with _YF_DOWNLOAD_LOCK:
+                self.data = yf.download(self.ticker, start=start_date, end=end_date)['Adj Close']
         except Exception as e:
             print(f"Error fetching data for {self.ticker}: {e}")
             self.data = pd.Series(dtype='float64')
@@ -140,13 +352,28 @@ class Portfolio:
         history (pd.Series): A time series of the portfolio's total value over time.
     """
 
-    def __init__(self):
+    def __init__(self, seed=None):
         """
         Initializes an empty portfolio.
+
+        Args:
+            seed (int, optional): The seed of the random number generator used for Monte Carlo simulations.
         """
         self.instruments = {}
         self.returns = None
         self.history = pd.Series(dtype='float64')
+        self._price_matrix = None
+        self._returns_matrix = None
+        self._tickers_order = []
+        self._common_index = None
+        self._last_prices_vec = None
+        self._quantities_vec = None
+        self._cov_cache = None
+        self._weights_cache = None
+        self._last_values_cache = None
+        self._history_dirty = True
+        self._returns_dirty = True
+        self._rng = np.random.default_rng(seed)
 
     def add_instrument(self, instrument):
         """
@@ -160,17 +387,178 @@ class Portfolio:
             self.instruments[instrument.ticker].update_quantity(instrument.quantity)
         else:
             self.instruments[instrument.ticker] = instrument
+            instrument._portfolio = self
+            self._invalidate_cache()
+
+    def _invalidate_cache(self):
+        """
+        Discards the cached price and returns matrices, and everything derived from them,
+        so that they are rebuilt on next use.
+        """
+        self._price_matrix = None
+        self._returns_matrix = None
+        self._tickers_order = []
+        self._common_index = None
+        self._last_prices_vec = None
+        self._quantities_vec = None
+        self._cov_cache = None
+        self._returns_dirty = True
+        self._invalidate_weights()
+
+    def _quantity_changed(self, instrument):
+        """
+        Writes an instrument's new quantity into the quantities vector and discards the weights.
+
+        Args:
+            instrument (FinancialInstrument): The instrument whose quantity changed.
+        """
+        if self._quantities_vec is not None and instrument._col_idx is not None:
+            self._quantities_vec[instrument._col_idx] = instrument.quantity
+        self._invalidate_weights()
+
+    def _invalidate_weights(self):
+        """
+        Discards the cached weights after a change in instrument quantities, and marks the
+        portfolio value as out of date. The returns do not depend on quantities.
+        """
+        self._weights_cache = None
+        self._last_values_cache = None
+        self._history_dirty = True
+
+    def _build_price_matrix(self):
+        """
+        Copies the price data of all instruments into a preallocated (T, N) float64 matrix, aligned
+        on the dates shared by every instrument, together with the matching (N,) quantities
+        vector. Instruments without data are left out.
+        """
+        self._invalidate_cache()
+        priced = {ticker: instrument._data for ticker, instrument in self.instruments.items()
+                  if instrument._data is not None and not instrument._data.empty}
+        for instrument in self.instruments.values():
+            instrument._col_idx = None
+        if priced:
+            common_index = None
+            for data in priced.values():
+                if common_index is None:
+                    common_index = data.index
+                elif not data.index.equals(common_index):
+                    common_index = common_index.intersection(data.index)
+            prices = np.empty((len(common_index), len(priced)), dtype=np.float64)
+            for col_idx, data in enumerate(priced.values()):
+                if not data.index.equals(common_index):
+                    data = data.reindex(common_index)
+                prices[:, col_idx] = data.to_numpy(dtype=np.float64)
+            self._tickers_order = list(priced)
+            self._common_index = common_index
+            self._price_matrix = prices
+            self._quantities_vec = np.fromiter((self.instruments[t].quantity for t in self._tickers_order),
+                                               dtype=np.float64, count=len(self._tickers_order))
+            for col_idx, ticker in enumerate(self._tickers_order):
+                self.instruments[ticker]._col_idx = col_idx
+            if self._price_matrix.shape[0]:
+                self._last_prices_vec = self._price_matrix[-1]
+        else:
+            self._tickers_order = []
+            self._common_index = pd.DatetimeIndex([])
+            self._price_matrix = np.empty((0, 0), dtype=np.float64)
 
     def fetch_all_data(self, start_date, end_date):
         """
-        Fetches historical data for all financial instruments in the portfolio.
+        Fetches historical data for all financial instruments in the portfolio. Stocks are
+        downloaded in batches of up to YF_BATCH_SIZE symbols per request, one batch after another
+        as yf.download is not thread-safe, while any other instruments are fetched concurrently.
+        Fetches that fail, and concurrent fetches that do not finish within FETCH_TIMEOUT seconds,
+        leave their instruments with empty data. All results are collected before any instrument
+        is updated.
 
         Args:
             start_date (str): The start date for fetching data.
             end_date (str): The end date for fetching data.
         """
-        for instrument in self.instruments.values():
-            instrument.fetch_data(start_date, end_date)
+        from requests import RequestException
+
+        symbols = [instrument.ticker for instrument in self.instruments.values() if isinstance(instrument, Stock)]
+        others = [instrument for instrument in self.instruments.values() if not isinstance(instrument, Stock)]
+
+        executor = ThreadPoolExecutor(max_workers=FETCH_MAX_WORKERS)
+        futures = {executor.submit(self._fetch_instrument, instrument, start_date, end_date): [instrument.ticker]
+                   for instrument in others}
+
+        results = {}
+        for i in range(0, len(symbols), YF_BATCH_SIZE):
+            batch = symbols[i:i + YF_BATCH_SIZE]
+            try:
+                results.update(self._fetch_stock_batch(batch, start_date, end_date))
+            except (RequestException, KeyError) as e:
+                print(f"Error fetching data for {', '.join(batch)}: {e}")
+                results.update((ticker, pd.Series(dtype='float64')) for ticker in batch)
+
+        _, not_done = wait(futures, timeout=FETCH_TIMEOUT)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+        # Workers only return their data, so late results of timed-out fetches are discarded here.
+        for future, tickers in futures.items():
+            try:
+                if future in not_done:
+                    raise TimeoutError(f"timed out after {FETCH_TIMEOUT} seconds")
+                results.update(future.result())
+            except (RequestException, KeyError, TimeoutError) as e:
+                print(f"Error fetching data for {', '.join(tickers)}: {e}")
+                results.update((ticker, pd.Series(dtype='float64')) for ticker in tickers)
+
+        for ticker, data in results.items():
+            self.instruments[ticker].data = data
+        self._build_price_matrix()
+
+    @staticmethod
+    def _fetch_stock_batch(symbols, start_date, end_date):
+        """
+        Downloads adjusted closing prices for the given stock symbols in a single multi-symbol
+        request.
+
+        Args:
+            symbols (list): The ticker symbols of the stocks to fetch.
+            start_date (str): The start date for fetching data.
+            end_date (str): The end date for fetching data.
+
+        Returns:
+            dict: The adjusted closing prices of each stock, keyed by ticker.
+        """
+        import yfinance as yf
+        with _YF_DOWNLOAD_LOCK:
+            df = yf.download(symbols, start=start_date, end=end_date, group_by='ticker',
+                             threads=True, progress=False, auto_adjust=False)
+        results = {}
+        for ticker in symbols:
+            try:
+                if isinstance(df.columns, pd.MultiIndex):
+                    data = df[ticker]['Adj Close']
+                else:
+                    data = df['Adj Close']
+                results[ticker] = data.dropna()
+            except KeyError:
+                print(f"Error fetching data for {ticker}: no data returned")
+                results[ticker] = pd.Series(dtype='float64')
+        return results
+
+    @staticmethod
+    def _fetch_instrument(instrument, start_date, end_date):
+        """
+        Fetches data for a single instrument on a detached copy, so that the instrument itself
+        is only updated by fetch_all_data.
+
+        Args:
+            instrument (FinancialInstrument): The instrument to fetch data for.
+            start_date (str): The start date for fetching data.
+            end_date (str): The end date for fetching data.
+
+        Returns:
+            dict: The fetched data of the instrument, keyed by its ticker.
+        """
+        detached = copy.copy(instrument)
+        detached._portfolio = None
+        detached.fetch_data(start_date, end_date)
+        return {instrument.ticker: detached._data}
 
     def compute_portfolio_value(self):
         """
@@ -179,28 +567,32 @@ class Portfolio:
         Returns:
             pd.Series: A time series of the portfolio's total value.
         """
-        values = []
-        for instrument in self.instruments.values():
-            if instrument.data is not None:
-                values.append(instrument.data * instrument.quantity)
-        if values:
-            self.history = pd.concat(values, axis=1).sum(axis=1)
+        if self._price_matrix is None:
+            self._build_price_matrix()
+        if self._tickers_order:
+            self.history = pd.Series(self._price_matrix @ self._quantities_vec, index=self._common_index, copy=False)
         else:
             self.history = pd.Series(dtype='float64')
+        self._history_dirty = False
         return self.history
 
     def compute_returns(self):
         """
         Computes the daily returns for the entire portfolio by combining the returns of all financial instruments.
         """
-        returns_dict = {}
-        for instrument in self.instruments.values():
-            instrument.compute_returns()
-            returns_dict[instrument.ticker] = instrument.returns
-        if returns_dict:
-            self.returns = pd.concat(returns_dict, axis=1)
+        if self._price_matrix is None:
+            self._build_price_matrix()
+        if self._price_matrix.size:
+            prices = self._price_matrix
+            returns = np.empty((prices.shape[0] - 1, prices.shape[1]), dtype=np.float64)
+            np.divide(prices[1:], prices[:-1], out=returns)
+            returns -= 1.0
+            self._returns_matrix = returns
+            self.returns = pd.DataFrame(returns, index=self._common_index[1:], columns=self._tickers_order, copy=False)
         else:
+            self._returns_matrix = None
             self.returns = pd.DataFrame(dtype='float64')
+        self._returns_dirty = False
 
     def get_returns(self):
         """
@@ -220,6 +612,80 @@ class Portfolio:
         """
         return self.history
 
+    def _ensure_computed(self):
+        """
+        Recomputes the portfolio value if instruments, data or quantities have changed since it was
+        last computed, and the returns if instruments or data have changed.
+        """
+        if self._history_dirty:
+            self.compute_portfolio_value()
+        if self._returns_dirty:
+            self.compute_returns()
+
+    def _check_return_data(self):
+        """
+        Checks that every instrument in the portfolio is part of the price matrix, so that a VaR
+        is never reported for only part of the portfolio, and that there is at least one return.
+
+        Raises:
+            ValueError: If any instrument has no price data, e.g. after a failed fetch, or if the
+                instruments share fewer than two dates.
+        """
+        if len(self._tickers_order) < len(self.instruments):
+            missing = [ticker for ticker in self.instruments if ticker not in self._tickers_order]
+            raise ValueError(f"Return data is empty for instrument: {', '.join(missing)}")
+        if self._returns_matrix is None or self._returns_matrix.shape[0] == 0:
+            raise ValueError("Cannot compute returns: fewer than two common dates across instruments.")
+
+    def _covariance(self):
+        """
+        Returns the covariance matrix of the instruments' daily returns, computing it on first use.
+
+        Returns:
+            np.ndarray: The covariance matrix of the daily returns.
+        """
+        if self._cov_cache is None:
+            self._cov_cache = np.atleast_2d(np.cov(self._returns_matrix, rowvar=False, ddof=1))
+        return self._cov_cache
+
+    def _current_values(self):
+        """
+        Returns the current value (last price times quantity) of each instrument, computing it on
+        first use. The values follow the column order of the returns.
+
+        Returns:
+            np.ndarray: The current value of each instrument.
+        """
+        if self._last_values_cache is None:
+            if self._price_matrix is None:
+                self._build_price_matrix()
+            self._last_values_cache = self._last_prices_vec * self._quantities_vec
+        return self._last_values_cache
+
+    def _current_value(self):
+        """
+        Returns the portfolio's current total value as the inner product of the last prices
+        and the quantities.
+
+        Returns:
+            float: The current value of the portfolio.
+        """
+        if self._price_matrix is None:
+            self._build_price_matrix()
+        return np.vdot(self._last_prices_vec, self._quantities_vec)
+
+    def _weights(self):
+        """
+        Returns the weight of each instrument in the portfolio's current value, computing it on
+        first use. The weights follow the column order of the returns.
+
+        Returns:
+            np.ndarray: The portfolio weight of each instrument.
+        """
+        if self._weights_cache is None:
+            self._weights_cache = self._current_values() / self._current_value()
+        return self._weights_cache
+
     def historical_var(self, time_horizon=1, percentile=0.95):
         """
         Calculates the portfolio's Value at Risk (VaR) using the historical method.
@@ -232,29 +698,20 @@ class Portfolio:
             float: The calculated Value at Risk (VaR) for the portfolio.
 
         Raises:
-            ValueError: If data has not been fetched or if the portfolio is empty.
+            ValueError: If data has not been fetched, if the portfolio is empty, if any instrument has no data,
+                or if the instruments share fewer than two dates.
         """
-        self.compute_portfolio_value()
-        self.compute_returns()
+        self._ensure_computed()
 
         if self.returns is None or self.history.empty:
             raise ValueError("Data has not been fetched or portfolio is empty.")
 
-        var_dict = {}
-        loss_percentile = (1 - percentile) * 100
-
-        for instrument in self.instruments.values():
-            if instrument.returns.empty:
-                raise ValueError(f"Return data is empty for instrument: {instrument.ticker}")
+        self._check_return_data()
 
-            percentile_return = np.percentile(instrument.returns, loss_percentile)
-            projected_value = instrument.data.iloc[-1] * (1 + percentile_return) * instrument.quantity
-            current_value = instrument.data.iloc[-1] * instrument.quantity
-            var_1day = current_value - projected_value
-            var_n_days = var_1day * np.sqrt(time_horizon)
-            var_dict[instrument.ticker] = var_n_days
-
-        portfolio_var = sum(var_dict.values())
+        loss_percentile = (1 - percentile) * 100
+        percentile_returns = _percentile(self._returns_matrix.copy(), loss_percentile)
+        var_vec = self._current_values() * -percentile_returns * np.sqrt(time_horizon)
+        portfolio_var = var_vec.sum()
         return portfolio_var
 
     def model_building_var(self, confidence_level=0.95, time_horizon=1):
@@ -269,28 +726,34 @@ class Portfolio:
             float: The calculated Value at Risk (VaR) for the portfolio.
 
         Raises:
-            ValueError: If data has not been fetched, if the portfolio is empty, or if the portfolio value is zero.
+            ValueError: If data has not been fetched, if the portfolio is empty, if any instrument has no data,
+                if the instruments share fewer than two dates, or if the portfolio value is zero.
         """
-        self.compute_returns()
+        self._ensure_computed()
 
         if self.returns is None or self.history.empty:
             raise ValueError("Data has not been fetched or portfolio is empty.")
+        self._check_return_data()
 
-        covariance_matrix = self.returns.cov()
-        portfolio_value = self.compute_portfolio_value().iloc[-1]
+        covariance_matrix = self._covariance()
+        portfolio_value = self._current_value()
 
         if portfolio_value == 0:
             raise ValueError("Portfolio value is zero. Cannot calculate VaR.")
 
-        weights = np.array([instrument.data.iloc[-1] * instrument.quantity / portfolio_value for instrument in self.instruments.values()])
-        portfolio_variance = np.dot(weights.T, np.dot(covariance_matrix, weights))
+        weights = self._weights()
+        from scipy.linalg.blas import dsymv
+        # The covariance matrix is symmetric, so its transpose is a Fortran-ordered view of the
+        # same matrix that dsymv can use without copying.
+        cov_weights = dsymv(1.0, covariance_matrix.T, weights, lower=1)
+        portfolio_variance = weights @ cov_weights
         portfolio_volatility = np.sqrt(portfolio_variance)
-        z_score = norm.ppf(1 - confidence_level)
+        z_score = _z_score(confidence_level)
         var_value = z_score * portfolio_volatility * portfolio_value
         var_value *= np.sqrt(time_horizon)
         return abs(var_value)
 
-    def monte_carlo_var(self, num_simulations, time_horizon, percentile):
+    def monte_carlo_var(self, num_simulations, time_horizon, percentile, dtype=np.float64, use_numba=False):
         """
         Calculates the portfolio's Value at Risk (VaR) using the Monte Carlo simulation method.
 
@@ -298,26 +761,33 @@ class Portfolio:
             num_simulations (int): The number of Monte Carlo simulations to run.
             time_horizon (int): The time horizon over which to calculate the VaR, in days.
             percentile (float): The confidence level for the VaR calculation.
+            dtype (np.dtype): The floating point type used for the simulations. np.float32 halves
+                the memory traffic at the cost of precision in the intermediate results.
+            use_numba (bool): Whether to run the simulations in a Numba-compiled loop, if Numba is installed.
 
         Returns:
             float: The calculated Value at Risk (VaR) for the portfolio.
 
         Raises:
-            ValueError: If data has not been fetched or if the portfolio is empty.
+            ValueError: If data has not been fetched, if the portfolio is empty, if any instrument has no data,
+                or if the instruments share fewer than two dates.
         """
-        self.compute_returns()
-        current_value = self.compute_portfolio_value().iloc[-1]
+        self._ensure_computed()
 
         if self.returns is None or self.history.empty:
             raise ValueError("Data has not been fetched or portfolio is empty.")
+        self._check_return_data()
+
+        current_value = self._current_value()
 
-        weights = np.array([instrument.data.iloc[-1] * instrument.quantity / current_value for instrument in self.instruments.values()])
-        mean_returns = self.returns.mean()
-        covariance_matrix = self.returns.cov()
-        simulated_returns = np.random.multivariate_normal(mean_returns, covariance_matrix, num_simulations)
-        simulated_portfolio_returns = np.dot(simulated_returns, weights)
+        weights = self._weights()
+        mean_returns = self._returns_matrix.mean(axis=0)
+        covariance_matrix = self._covariance()
+        L = _covariance_factor(covariance_matrix).astype(dtype)
+        simulated_portfolio_returns = mc_portfolio_returns(self._rng, L, mean_returns.astype(dtype),
+                                                           weights.astype(dtype), int(num_simulations), use_numba)
         portfolio_percent_changes = simulated_portfolio_returns * np.sqrt(time_horizon)
-        var_percentile = np.percentile(portfolio_percent_changes, 100 - (percentile * 100))
+        var_percentile = _percentile(portfolio_percent_changes, 100 - (percentile * 100))
         var_projected_value = current_value * (1 + var_percentile)
         var_loss = current_value - var_projected_value
         return var_loss
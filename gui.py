@@ -1,8 +1,6 @@
 import tkinter as tk
 from tkinter import messagebox
 from tkinter import ttk
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from backend import *
 
 class PortfolioApp:
@@ -15,6 +13,8 @@ class PortfolioApp:
         portfolio (Portfolio): The portfolio object containing the financial instruments.
         start_date (str): The start date for data fetching.
         end_date (str): The end date for data fetching.
+        plot_windows (dict): Persistent plot windows, keyed by plot name, each holding its
+            Toplevel window, axes and canvas.
     """
     def __init__(self, root, portfolio):
         """
@@ -31,6 +31,7 @@ class PortfolioApp:
         self.portfolio = portfolio
         self.start_date = None
         self.end_date = None
+        self.plot_windows = {}
         
         # Title Label
         self.title_label = tk.Label(root, text="Portfolio Value at Risk (VaR) Calculator", font=("Arial", 16))
@@ -136,12 +137,13 @@ class PortfolioApp:
         if self.portfolio.history.empty:
             messagebox.showerror("Error", "No data has been fetched or portfolio is empty.")
         else:
-            plt.figure()
-            plt.plot(self.portfolio.history.index, self.portfolio.history.values)
-            plt.title("Portfolio Value Over Time")
-            plt.xlabel("Date")
-            plt.ylabel("Portfolio Value")
-            plt.show()
+            ax, canvas = self.get_plot_window("portfolio", "Portfolio Data Plot")
+            ax.cla()
+            ax.plot(self.portfolio.history.index, self.portfolio.history.values)
+            ax.set_title("Portfolio Value Over Time")
+            ax.set_xlabel("Date")
+            ax.set_ylabel("Portfolio Value")
+            canvas.draw_idle()
 
     def plot_stock_data(self):
         """
@@ -151,10 +153,8 @@ class PortfolioApp:
             messagebox.showerror("Error", "No stocks in portfolio.")
             return
 
-        plot_window = tk.Toplevel(self.root)
-        plot_window.title("Stock Data Plot")
-
-        fig, ax = plt.subplots()
+        ax, canvas = self.get_plot_window("stock", "Stock Data Plot")
+        ax.cla()
 
         for instrument in self.portfolio.instruments.values():
             ax.plot(instrument.get_data().index, instrument.get_data().values, label=instrument.ticker)
@@ -163,10 +163,39 @@ class PortfolioApp:
         ax.set_xlabel("Date")
         ax.set_ylabel("Stock Price")
         ax.legend()
+        canvas.draw_idle()
+
+    def get_plot_window(self, name, title):
+        """
+        Returns the axes and canvas of a persistent plot window, creating the window on first use.
+        Closing the window hides it so that its figure can be reused by the next plot.
 
-        canvas = FigureCanvasTkAgg(fig, master=plot_window)
-        canvas.draw()
-        canvas.get_tk_widget().pack()
+        Args:
+            name (str): The key identifying the plot window.
+            title (str): The title of the plot window.
+
+        Returns:
+            tuple: The matplotlib axes and the FigureCanvasTkAgg of the window.
+        """
+        if name not in self.plot_windows:
+            # matplotlib is imported on first plot to keep application start-up fast.
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+            from matplotlib.figure import Figure
+
+            plot_window = tk.Toplevel(self.root)
+            plot_window.title(title)
+            plot_window.protocol("WM_DELETE_WINDOW", plot_window.withdraw)
+
+            fig = Figure()
+            ax = fig.add_subplot()
+            canvas = FigureCanvasTkAgg(fig, master=plot_window)
+            canvas.get_tk_widget().pack(fill="both", expand=True)
+            self.plot_windows[name] = (plot_window, ax, canvas)
+
+        plot_window, ax, canvas = self.plot_windows[name]
+        plot_window.deiconify()
+        plot_window.lift()
+        return ax, canvas
 
     def add_stock(self):
         """